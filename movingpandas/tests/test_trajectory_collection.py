@@ -22,7 +22,7 @@ from movingpandas.trajectory import (
     TIMEDELTA_COL_NAME,
 )
 from movingpandas.trajectory_collection import TrajectoryCollection
-from . import requires_holoviews
+from . import requires_datashader, requires_holoviews
 
 CRS_METRIC = from_epsg(31256)
 CRS_LATLON = from_epsg(4326)
@@ -177,6 +177,9 @@ class TestTrajectoryCollection:
         assert self.collection.get_min("val") == 2
         assert self.collection.get_max("val") == 10
 
+    def test_get_min_max(self):
+        assert self.collection.get_min_max("val") == (2, 10)
+
     def test_plot_exists(self):
         from matplotlib.axes import Axes
 
@@ -203,6 +206,17 @@ class TestTrajectoryCollection:
         plot = self.collection_latlon.hvplot(c="id", colormap={1: "red", 2: "blue"})
         assert isinstance(plot, holoviews.core.overlay.Overlay)
 
+    @requires_holoviews
+    @requires_datashader
+    def test_hvplot_rasterized_exists(self):
+        import holoviews
+
+        plot = self.collection_latlon.hvplot(rasterize=True)
+        assert isinstance(plot, holoviews.core.spaces.DynamicMap)
+
+        plot = self.collection_latlon.hvplot(datashade=True)
+        assert isinstance(plot, holoviews.core.spaces.DynamicMap)
+
     def test_plot_exist_column(self):
         from matplotlib.axes import Axes
 
@@ -2,6 +2,7 @@
 
 import warnings
 
+import numpy as np
 from shapely.affinity import translate
 from shapely.geometry import Point, LineString
 from pandas import DataFrame, to_datetime, Series
@@ -17,6 +18,7 @@ except ImportError:
 from .overlay import clip, intersection, intersects, create_entry_and_exit_points
 from .spatiotemporal_utils import STRange
 from .geometry_utils import (
+    SHAPELY_GE_2,
     angular_difference,
     azimuth,
     calculate_initial_compass_bearing,
@@ -201,6 +203,20 @@ class Trajectory:
             and self.parent == other.parent
         )
 
+    @property
+    def _xy(self):
+        """
+        Return the trajectory point coordinates as a (n, 2) float64 array.
+
+        Computed on demand from the geometry column rather than cached,
+        since the trajectory's dataframe is mutable.
+        """
+        if SHAPELY_GE_2:
+            from shapely import get_coordinates
+
+            return get_coordinates(self.df.geometry.values)
+        return np.array([[pt.x, pt.y] for pt in self.df.geometry])
+
     def size(self):
         """
         Returns number of rows in Trajectory.df
@@ -375,6 +391,23 @@ class Trajectory:
         """
         return self.df[column].max()
 
+    def get_min_max(self, column):
+        """
+        Return minimum and maximum value in the provided DataFrame column
+
+        Parameters
+        ----------
+        column : string
+            Name of the DataFrame column
+
+        Returns
+        -------
+        tuple
+            Minimum and maximum value
+        """
+        values = self.df[column]
+        return values.min(), values.max()
+
     def get_column_names(self):
         """
         Return the list of column names
@@ -496,11 +529,9 @@ class Trajectory:
             WKT of trajectory as LineStringM
         """
         # Shapely only supports x, y, z. Therefore, this is a bit hacky!
-        coords = []
-        for index, row in self.df.iterrows():
-            pt = row[self.get_geom_col()]
-            t = to_unixtime(index)
-            coords.append(f"{pt.x} {pt.y} {t}")
+        coords = [
+            f"{x} {y} {to_unixtime(t)}" for (x, y), t in zip(self._xy, self.df.index)
+        ]
         wkt = f"LINESTRING M ({', '.join(coords)})"
         return wkt
 
@@ -529,14 +560,16 @@ class Trajectory:
         -------
         GeoDataFrame
         """
-        line_gdf = self._to_line_df(columns)
-        line_gdf.drop(columns=[self.get_geom_col(), "prev_pt"], inplace=True)
-        line_gdf.reset_index(drop=True, inplace=True)
-        line_gdf.rename(columns={"line": "geometry"}, inplace=True)
-        line_gdf.set_geometry("geometry", inplace=True)
-        if self.crs:
-            line_gdf.set_crs(self.crs, inplace=True)
-        return line_gdf
+        geom_col = self.get_geom_col()
+        if columns is None:
+            keep_cols = [col for col in self.df.columns if col != geom_col]
+        else:
+            keep_cols = [col for col in columns if col != geom_col]
+        lines = self._make_line_geometries()
+        df = DataFrame(self.df[keep_cols].iloc[1:].reset_index(drop=True))
+        df["t"] = self.df.index[1:]
+        df["prev_t"] = self.df.index[:-1]
+        return GeoDataFrame(df, geometry=lines, crs=self.crs)
 
     def to_traj_gdf(self, wkt=False, agg=False):
         """
@@ -945,8 +978,34 @@ class Trajectory:
         return get_speed2(pt0, pt1, row["delta_t"], self.is_latlon, conversion)
 
     def _connect_prev_pt_and_geometry(self, row):
-        pt0 = row["prev_pt"]
-        pt1 = row[self.get_geom_col()]
+        return self._connect_points(row["prev_pt"], row[self.get_geom_col()])
+
+    def _make_line_geometries(self):
+        """
+        Build the LineStrings connecting consecutive trajectory points.
+
+        Uses the vectorized Shapely 2.0 constructor where available and falls
+        back to connecting the points pairwise otherwise.
+        """
+        geoms = self.df.geometry
+        if SHAPELY_GE_2:
+            from shapely import get_coordinates, linestrings
+
+            coords = get_coordinates(geoms.values, include_z=geoms.has_z.any())
+            if len(coords) == len(geoms):
+                starts = coords[:-1]
+                ends = coords[1:].copy()
+                # to avoid intersection issues with zero length lines
+                zero_length = (starts == ends).all(axis=1)
+                ends[zero_length, :2] += 0.00000001
+                return linestrings(np.stack([starts, ends], axis=1))
+        # non-point geometries: connect pairwise for proper error reporting
+        return [
+            self._connect_points(pt0, pt1)
+            for pt0, pt1 in zip(geoms.iloc[:-1], geoms.iloc[1:])
+        ]
+
+    def _connect_points(self, pt0, pt1):
         if not isinstance(pt0, Point):
             return None
         if not isinstance(pt1, Point):
@@ -312,23 +312,33 @@ class TrajectoryCollection:
 
         for traj in self:
             if t == "start":
-                tmp = traj.copy()
                 if with_direction and direction_missing:
-                    tmp.df = tmp.df.head(2)
+                    # only the first two rows are needed to compute the
+                    # direction, so avoid copying the whole trajectory
+                    tmp = Trajectory(
+                        traj.df.head(2), traj.id, traj_id_col=traj.get_traj_id_col()
+                    )
                     tmp.add_direction(name=direction_col)
+                else:
+                    tmp = traj
                 x = tmp.get_row_at(tmp.get_start_time())
             elif t == "end":
-                tmp = traj.copy()
                 if with_direction and direction_missing:
-                    tmp.df = tmp.df.tail(2)
+                    tmp = Trajectory(
+                        traj.df.tail(2), traj.id, traj_id_col=traj.get_traj_id_col()
+                    )
                     tmp.add_direction(name=direction_col)
+                else:
+                    tmp = traj
                 x = tmp.get_row_at(tmp.get_end_time())
             else:
                 if t < traj.get_start_time() or t > traj.get_end_time():
                     continue
-                tmp = traj.copy()
                 if with_direction and direction_missing:
+                    tmp = traj.copy()
                     tmp.add_direction(name=direction_col)
+                else:
+                    tmp = traj
                 x = tmp.get_row_at(t)
             result.append(x.to_frame().T)
 
@@ -639,7 +649,7 @@ class TrajectoryCollection:
         Sortable
             Minimum value
         """
-        return min([traj.df[column].min() for traj in self])
+        return concat([traj.df[column] for traj in self]).min()
 
     def get_max(self, column):
         """
@@ -655,7 +665,25 @@ class TrajectoryCollection:
         Sortable
             Maximum value
         """
-        return max([traj.df[column].max() for traj in self])
+        return concat([traj.df[column] for traj in self]).max()
+
+    def get_min_max(self, column):
+        """
+        Return minimum and maximum value in the provided DataFrame column
+        over all trajectories
+
+        Parameters
+        ----------
+        column : string
+            Name of the DataFrame column
+
+        Returns
+        -------
+        tuple
+            Minimum and maximum value
+        """
+        values = concat([traj.df[column] for traj in self])
+        return values.min(), values.max()
 
     def plot(self, *args, **kwargs):
         """
@@ -696,6 +724,11 @@ class TrajectoryCollection:
 
         >>> collection.hvplot(c='speed', line_width=7.0, width=700, height=400,
                               colorbar=True)
+
+        Rasterize large collections instead of drawing individual segments
+        (requires datashader):
+
+        >>> collection.hvplot(rasterize=True)
         """  # noqa: E501
         return _TrajectoryPlotter(self, *args, **kwargs).hvplot()
 
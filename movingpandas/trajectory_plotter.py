@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 
-import matplotlib.pyplot as plt
+import numpy as np
+
+from .geometry_utils import SHAPELY_GE_2
+
+if SHAPELY_GE_2:
+    from shapely import get_coordinates
 
 
 class _TrajectoryPlotter:
@@ -20,10 +25,10 @@ class _TrajectoryPlotter:
         self.clim = self.kwargs.pop("clim", None)
         self.colorbar = self.kwargs.pop("colorbar", True)
 
-        self.min_value = kwargs.get("vmin", None)
-        self.max_value = kwargs.get("vmax", None)
+        self.min_value = kwargs.pop("vmin", None)
+        self.max_value = kwargs.pop("vmax", None)
 
-        self.overlay = None
+        self.added_columns = []
         self.hvplot_is_geo = kwargs.pop("geo", True)
         self.hvplot_tiles = kwargs.pop("tiles", "OSM")
 
@@ -45,20 +50,23 @@ class _TrajectoryPlotter:
         }
 
     def get_min_max_values(self):
-        min_value = self.data.get_min(self.column)
-        max_value = self.data.get_max(self.column)
-        self.min_value = self.kwargs.pop("vmin", min_value)
-        self.max_value = self.kwargs.pop("vmax", max_value)
+        min_value, max_value = self.data.get_min_max(self.column)
+        if self.min_value is None:
+            self.min_value = min_value
+        if self.max_value is None:
+            self.max_value = max_value
         return min_value, max_value
 
     def plot(self):
+        import matplotlib.pyplot as plt
+
         if not self.ax:
             self.ax = plt.figure(figsize=self.figsize).add_subplot(1, 1, 1)
         tc = self.preprocess_data()
         line_plot = self.plot_lines(tc)
 
-        to_drop = [x for x in tc.get_column_names() if x not in self.column_names]
-        tc.drop(columns=to_drop)
+        if self.added_columns:
+            tc.drop(columns=self.added_columns)
 
         return line_plot
 
@@ -70,33 +78,118 @@ class _TrajectoryPlotter:
 
         if self.column:
             if self.column == self.speed_col_name and self.speed_col_missing:
-                tc.add_speed(overwrite=True)
-
-            (min_val, max_val) = self.get_min_max_values()
+                self.add_speed_and_get_min_max(tc)
+            else:
+                self.get_min_max_values()
             if self.clim is None:
-                self.clim = (min_val, max_val)
+                self.clim = (self.min_value, self.max_value)
 
         return tc
 
+    def add_speed_and_get_min_max(self, tc):
+        """
+        Add speed values and track their min/max within the same pass over
+        the trajectories, avoiding a second iteration just for the limits.
+        """
+        try:
+            trajectories = tc.trajectories
+        except AttributeError:
+            trajectories = [tc]
+        mins = []
+        maxs = []
+        for traj in trajectories:
+            traj.add_speed(overwrite=True)
+            mins.append(traj.df[self.speed_col_name].min())
+            maxs.append(traj.df[self.speed_col_name].max())
+        self.added_columns.append(self.speed_col_name)
+        if self.min_value is None:
+            self.min_value = min(mins)
+        if self.max_value is None:
+            self.max_value = max(maxs)
+
     def plot_lines(self, tc):
+        from matplotlib.cm import ScalarMappable
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import Normalize
+
         line_gdf = tc.to_line_gdf()
 
-        if self.column and self.colormap:
-            line_gdf["color"] = "grey"
-            line_gdf["color"] = line_gdf[self.column].apply(lambda x: self.colormap[x])
-            return line_gdf.plot(
-                ax=self.ax, color=line_gdf["color"], *self.args, **self.kwargs
+        # Draw all segments as a single LineCollection instead of creating
+        # one artist per segment via GeoDataFrame.plot()
+        segments = self.get_segments(line_gdf)
+        kwargs = {
+            key: value
+            for key, value in self.kwargs.items()
+            if key not in ("column", "c", "color", "cmap", "vmin", "vmax", "legend")
+        }
+        if self.column is None:
+            color = self.kwargs.get("color")
+            if color is not None:
+                kwargs["colors"] = color
+            lines = LineCollection(segments, linewidths=self.line_width, **kwargs)
+        elif self.colormap:
+            colors = self.map_colors(line_gdf[self.column])
+            lines = LineCollection(
+                segments, colors=colors, linewidths=self.line_width, **kwargs
             )
         else:
-            self.kwargs.pop("vmin", None)
-            self.kwargs.pop("vmax", None)
-            return line_gdf.plot(
-                ax=self.ax,
-                vmin=self.min_value,
-                vmax=self.max_value,
-                *self.args,
-                **self.kwargs
+            # one shared normalization and mappable for the whole collection
+            norm = Normalize(*self.clim)
+            lines = LineCollection(
+                segments,
+                array=line_gdf[self.column].to_numpy(dtype=float),
+                cmap=self.kwargs.get("cmap"),
+                norm=norm,
+                linewidths=self.line_width,
+                **kwargs
             )
+            if self.kwargs.get("legend"):
+                mappable = ScalarMappable(norm=norm, cmap=lines.get_cmap())
+                self.ax.figure.colorbar(mappable, ax=self.ax)
+        self.ax.add_collection(lines)
+        self.set_aspect(line_gdf)
+        self.ax.autoscale_view()
+        return self.ax
+
+    def set_aspect(self, line_gdf):
+        # same default aspect as GeoDataFrame.plot(): compensate for the
+        # latitude-dependent distortion of geographic coordinates
+        if line_gdf.crs and line_gdf.crs.is_geographic:
+            bounds = line_gdf.total_bounds
+            mean_y = np.mean([bounds[1], bounds[3]])
+            self.ax.set_aspect(1 / np.cos(np.deg2rad(mean_y)))
+        else:
+            self.ax.set_aspect("equal")
+
+    def map_colors(self, values):
+        """
+        Map the segment values to per-segment RGBA colors using the colormap
+        dict. Unmapped values fall back to grey.
+
+        Numeric colormap keys are resolved with a vectorized searchsorted
+        lookup; other keys use a pandas map.
+        """
+        from matplotlib.colors import to_rgba, to_rgba_array
+
+        keys = np.array(list(self.colormap))
+        if np.issubdtype(keys.dtype, np.number) and np.issubdtype(
+            values.dtype, np.number
+        ):
+            order = np.argsort(keys)
+            keys = keys[order]
+            # last row acts as the fallback color for unmapped values
+            rgba = to_rgba_array([self.colormap[key] for key in keys])
+            rgba = np.vstack([rgba, to_rgba("grey")])
+            vals = values.to_numpy()
+            idx = np.minimum(np.searchsorted(keys, vals), len(keys) - 1)
+            idx = np.where(keys[idx] == vals, idx, len(keys))
+            return rgba[idx]
+        return values.map(self.colormap).fillna("grey").to_numpy()
+
+    def get_segments(self, line_gdf):
+        if SHAPELY_GE_2:
+            return get_coordinates(line_gdf.geometry.values).reshape(-1, 2, 2)
+        return [list(line.coords) for line in line_gdf.geometry]
 
     def hvplot(self):  # noqa F811
         try:
@@ -112,6 +205,18 @@ class _TrajectoryPlotter:
                 "https://geoviews.org)."
             ) from error
 
+        self.rasterize = self.kwargs.get("rasterize", False) or self.kwargs.get(
+            "datashade", False
+        )
+        if self.rasterize:
+            try:
+                import datashader  # noqa F401
+            except ImportError as error:
+                raise ImportError(
+                    "Missing optional dependencies. To use rasterized plotting, "
+                    "install datashader (see https://datashader.org)."
+                ) from error
+
         opts.defaults(opts.Overlay(**self.hv_defaults))
         self.MPD_PALETTE = list(Category10_10) + cc.palette["glasbey"]
 
@@ -119,17 +224,19 @@ class _TrajectoryPlotter:
 
         tc = self.preprocess_data()
 
+        # resolve the colormap defaults once, before any plot element is
+        # built, so the line and end-marker plots share the same settings
+        if self.column:
+            self.set_default_cmaps()
+
         plot = self.hvplot_lines(tc)
         if self.marker_size > 0:
             plot = plot * self.hvplot_end_points(tc)
 
-        to_drop = [x for x in tc.get_column_names() if x not in self.column_names]
-        tc.drop(columns=to_drop)
+        if self.added_columns:
+            tc.drop(columns=self.added_columns)
 
-        if self.overlay:
-            return self.overlay * plot
-        else:
-            return plot
+        return plot
 
     def hvplot_end_points(self, tc):
         from holoviews import dim, Overlay
@@ -137,24 +244,38 @@ class _TrajectoryPlotter:
         try:
             end_pts = tc.get_end_locations(with_direction=True)
         except AttributeError:
-            tc.add_direction(name=self.direction_col_name, overwrite=True)
+            # single trajectory: only the direction of the final segment is
+            # needed, so compute it from the last two points instead of
+            # writing a direction column to the full dataframe
             end_pts = tc.df.tail(1).copy()
+            if self.direction_col_name not in end_pts.columns:
+                end_pts[self.direction_col_name] = tc._compute_heading(
+                    {
+                        "prev_pt": tc.df.geometry.iloc[-2],
+                        tc.get_geom_col(): tc.df.geometry.iloc[-1],
+                    }
+                )
 
         end_pts["triangle_angle"] = end_pts[self.direction_col_name] * -1.0
         end_pts["triangle_angle"] = end_pts["triangle_angle"].astype(float)
 
-        hover_cols = self.kwargs.pop("hover_cols", None)
-
-        self.kwargs["hover_cols"] = ["triangle_angle"]
-        if hover_cols:
-            self.kwargs["hover_cols"] = self.kwargs["hover_cols"] + hover_cols
-        if self.marker_color:
-            self.kwargs["color"] = self.marker_color
+        # build the marker kwargs locally so self.kwargs is not mutated
+        kwargs = dict(self.kwargs)
+        # the end markers are always drawn as vector triangles; rasterizing
+        # only applies to the line plot
+        kwargs.pop("rasterize", None)
+        kwargs.pop("datashade", None)
+        hover_cols = ["triangle_angle"]
+        user_hover_cols = kwargs.pop("hover_cols", None)
+        if user_hover_cols:
+            hover_cols = hover_cols + user_hover_cols
         if self.column:
-            self.kwargs["hover_cols"] = self.kwargs["hover_cols"] + [self.column]
+            hover_cols = hover_cols + [self.column]
+        kwargs["hover_cols"] = hover_cols
+        if self.marker_color:
+            kwargs["color"] = self.marker_color
 
-        if self.hvplot_is_geo and not tc.is_latlon and tc.get_crs() is not None:
-            end_pts = end_pts.to_crs(epsg=4326)
+        end_pts = self.to_latlon(end_pts)
 
         if self.column:
             return end_pts.hvplot(
@@ -165,10 +286,11 @@ class _TrajectoryPlotter:
                 size=self.marker_size,
                 clim=self.clim,
                 *self.args,
-                **self.kwargs
+                **kwargs
             )
         else:
             plots = []
+            color = kwargs.pop("color", None)
             for i in range(len(end_pts)):
                 tmp = end_pts.iloc[i : i + 1, :]
                 tmp = tmp.hvplot(
@@ -177,9 +299,9 @@ class _TrajectoryPlotter:
                     marker="triangle",
                     angle=dim("triangle_angle"),
                     size=self.marker_size,
-                    color=self.get_color(i),
+                    color=color if color else self.get_color(i),
                     *self.args,
-                    **self.kwargs
+                    **kwargs
                 )
                 plots.append(tmp)
             return Overlay(plots)
@@ -192,11 +314,24 @@ class _TrajectoryPlotter:
             cols = cols + [self.column]
         cols = list(set(cols))
 
-        if self.column is None:
+        if self.column is None and not self.rasterize:
             return self.hvplot_traj_gdf(tc)
         else:
+            # rasterized plots aggregate all segments in a single datashader
+            # pass, so they always use the one combined line GeoDataFrame
             return self.hvplot_line_gdf(tc, cols)
 
+    def to_latlon(self, gdf):
+        """
+        Reproject the GeoDataFrame to EPSG:4326 for geo plotting, unless its
+        CRS is unknown or already geographic.
+        """
+        if not self.hvplot_is_geo:
+            return gdf
+        if gdf.crs is None or gdf.crs.is_geographic:
+            return gdf
+        return gdf.to_crs(epsg=4326)
+
     def get_color(self, i):
         if self.color:
             return self.color
@@ -209,8 +344,7 @@ class _TrajectoryPlotter:
         Cycle.default_cycles["default_colors"] = self.MPD_PALETTE
 
         traj_gdf = tc.to_traj_gdf()
-        if self.hvplot_is_geo and not tc.is_latlon and tc.get_crs() is not None:
-            traj_gdf = traj_gdf.to_crs(epsg=4326)
+        traj_gdf = self.to_latlon(traj_gdf)
 
         plots = []
         for i in range(len(traj_gdf)):
@@ -230,14 +364,7 @@ class _TrajectoryPlotter:
 
     def hvplot_line_gdf(self, tc, cols):
         line_gdf = tc.to_line_gdf(columns=cols)
-
-        ids = None
-        if self.column is None and self.traj_id_col_name is not None:
-            ids = line_gdf[self.traj_id_col_name].unique()
-        self.set_default_cmaps(ids)
-
-        if self.hvplot_is_geo and not tc.is_latlon and tc.get_crs() is not None:
-            line_gdf = line_gdf.to_crs(epsg=4326)
+        line_gdf = self.to_latlon(line_gdf)
 
         return line_gdf.hvplot(
             line_width=self.line_width,
@@ -249,18 +376,12 @@ class _TrajectoryPlotter:
             **self.kwargs
         )
 
-    def set_default_cmaps(self, ids=None):
+    def set_default_cmaps(self):
         from holoviews import Cycle
 
         Cycle.default_cycles["default_colors"] = self.MPD_PALETTE
         if self.column == self.speed_col_name and "cmap" not in self.kwargs:
             self.kwargs["cmap"] = "Plasma"
-        elif self.column is None and self.traj_id_col_name is not None:
-            self.kwargs["c"] = self.traj_id_col_name
-            if "cmap" not in self.kwargs:
-                print("building colormap ...")
-                self.kwargs["colormap"] = dict(zip(ids, self.MPD_PALETTE[: len(ids)]))
-                print(self.kwargs["colormap"])
         if self.colormap:
             self.kwargs["colormap"] = self.colormap
         if "cmap" not in self.kwargs and "colormap" not in self.kwargs: